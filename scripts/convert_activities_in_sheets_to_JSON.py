@@ -10,15 +10,22 @@ import re
 import os
 import shutil
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
 # For Google Sheets integration
 GOOGLE_SHEETS_URL = "https://docs.google.com/spreadsheets/d/138_Jq0OGLWXbtP3Qz8ZRrt94VO8u75tcrEzJAz-f50Q/edit?usp=sharing"  # Replace with your sheet URL
 
-# Smart defaults
+# Smart defaults (unknown categories fall back to the "default" entry)
 CATEGORY_COLORS = {
     "celebration": "#FFD700",
     "nature": "#FF6347",
@@ -47,73 +54,169 @@ DEFAULT_ICONS = {
     "default": "⭐"
 }
 
+# Read-only sub-dict templates shared by every activity that uses the defaults
+_DEFAULT_AGE_RANGE = {
+    "start": 0,
+    "end": None,
+    "flexible_end": True
+}
+
+_DISPLAY_BY_CATEGORY = {
+    category: {"icon": DEFAULT_ICONS[category], "color": color}
+    for category, color in CATEGORY_COLORS.items()
+}
+
+# Buffer size for writing the output file
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Above this many activities the output file is written one activity at a time
+STREAM_THRESHOLD = 10_000
+
+# Known sheet columns
+REQUIRED_COLUMNS = ['name', 'category', 'frequency']
+OPTIONAL_COLUMNS = ['description', 'icon', 'age_start', 'age_end', 'color', 'is_active', 'user_created']
+KNOWN_COLUMNS = frozenset(REQUIRED_COLUMNS + OPTIONAL_COLUMNS)
+
+# Read every cell as text (no type inference) and only keep the known columns
+CSV_READ_OPTIONS = {
+    "dtype": str,
+    "keep_default_na": False,
+    "na_values": [""],
+    "usecols": lambda column: column in KNOWN_COLUMNS,
+    "engine": "c"
+}
+
+# Precompiled patterns for ID generation and frequency parsing
+_ID_STRIP = re.compile(r'[^\w\s-]')
+_ID_GAP = re.compile(r'[-\s]+')
+_FREQ_RE = re.compile(r'^(\d+)\s*/\s*(year|month|week|day)')
+
+# Whole numbers at or above this magnitude don't fit in an int64
+_INT64_LIMIT = float(2 ** 63)
+# Whole numbers above this lose precision as float64
+_FLOAT_EXACT_LIMIT = float(2 ** 53)
 
-def generate_id(name: str) -> str:
-    """Generate a valid ID from the activity name"""
-    # Convert to lowercase, replace spaces with underscores, remove special chars
-    id_str = name.lower().strip()
-    id_str = re.sub(r'[^\w\s-]', '', id_str)
-    id_str = re.sub(r'[-\s]+', '_', id_str)
-    return id_str
+# Values treated as True for the is_active / user_created columns
+_TRUE_ACTIVE = frozenset({'true', 'yes', '1', 'active', 'on'})
+_TRUE_USER = frozenset({'true', 'yes', '1', 'user', 'custom'})
+
+
+# Frequency aliases and per-period multipliers (everything is normalized to year)
+FREQUENCY_ALIASES = {
+    "daily": 365,
+    "everyday": 365,
+    "every day": 365,
+    "weekly": 52,
+    "every week": 52,
+    "monthly": 12,
+    "every month": 12,
+    "yearly": 1,
+    "annually": 1,
+    "every year": 1
+}
+
+PERIOD_MULTIPLIERS = {
+    "day": 365,
+    "week": 52,
+    "month": 12,
+    "year": 1
+}
 
 
 def parse_frequency(freq_str: str) -> Dict[str, Any]:
     """
     Parse frequency string like '1/year', '52/year', '1/week', '365/year'
     Returns dict with 'times' and 'period'
+    Scalar fallback for the rows parse_frequencies can't handle
     """
     freq_str = freq_str.strip().lower()
     
     # Handle special cases
-    if freq_str in ['daily', 'everyday', 'every day']:
-        return {"times": 365, "period": "year"}
-    elif freq_str in ['weekly', 'every week']:
-        return {"times": 52, "period": "year"}
-    elif freq_str in ['monthly', 'every month']:
-        return {"times": 12, "period": "year"}
-    elif freq_str in ['yearly', 'annually', 'every year']:
-        return {"times": 1, "period": "year"}
-    
-    # Parse format like "1/year" or "52/year"
-    match = re.match(r'(\d+)\s*/\s*(year|month|week|day)', freq_str)
+    if freq_str in FREQUENCY_ALIASES:
+        return {"times": FREQUENCY_ALIASES[freq_str], "period": "year"}
+    
+    # Parse format like "1/year" or "52/year", normalized to year-based for consistency
+    match = _FREQ_RE.match(freq_str)
     if match:
-        times = int(match.group(1))
-        period = match.group(2)
-        
-        # Normalize to year-based for consistency
-        if period == "week":
-            times = times * 52
-            period = "year"
-        elif period == "month":
-            times = times * 12
-            period = "year"
-        elif period == "day":
-            times = times * 365
-            period = "year"
-            
-        return {"times": times, "period": period}
+        times = int(match.group(1)) * PERIOD_MULTIPLIERS[match.group(2)]
+        if times < _INT64_LIMIT:
+            return {"times": times, "period": "year"}
     
     # Default fallback
     print(f"Warning: Could not parse frequency '{freq_str}', defaulting to 1/year")
     return {"times": 1, "period": "year"}
 
 
-def create_activity(row: pd.Series) -> Dict[str, Any]:
-    """Convert a CSV row to a full activity JSON object"""
-    # Required fields
-    name = str(row['name']).strip()
-    category = str(row['category']).strip().lower()
-    frequency_str = str(row['frequency']).strip()
-    
-    # Generate ID
-    activity_id = generate_id(name)
-    
-    # Parse frequency
-    frequency = parse_frequency(frequency_str)
+def normalize_text(values: pd.Series, lower: bool = False) -> pd.Series:
+    """
+    Strip (and optionally lowercase) a whole column in one pass
+    Returns object dtype so later .str regexes use Python's unicode-aware re
+    """
+    values = values.astype(str).str.strip()
+    if lower:
+        values = values.str.lower()
+    return values.astype(object)
+
+
+def parse_frequencies(freqs: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Vectorized parse_frequency for a whole column
+    Returns the 'times' and 'period' values as two Series
+    """
+    freqs = normalize_text(freqs, lower=True)
+    
+    # Handle special cases, then parse format like "1/year" for the rest
+    alias_times = freqs.map(FREQUENCY_ALIASES)
+    parts = freqs.str.extract(_FREQ_RE)
+    counts = pd.to_numeric(parts[0], errors='coerce').astype(float)
+    multipliers = parts[1].map(PERIOD_MULTIPLIERS)
+    # Yearly counts too large to hold exactly in a float are left to the scalar fallback
+    parsed = counts.notna() & (counts * multipliers <= _FLOAT_EXACT_LIMIT)
+    parsed_times = (counts * multipliers).where(parsed)
+    times = alias_times.combine_first(parsed_times)
+    
+    # Anything left goes through parse_frequency, which warns and defaults to 1/year
+    unparsed = times.isna()
+    if unparsed.any():
+        times = times.astype(object)  # keeps the fallback's exact Python ints
+        times[unparsed] = [parse_frequency(freq_str)["times"] for freq_str in freqs[unparsed]]
+    
+    times = times.astype(np.int64)
+    periods = pd.Series("year", index=freqs.index, dtype=object)
+    return times, periods
+
+
+def create_activity(name: str, category: str, activity_id: str, frequency: Dict[str, Any],
+                    icon: str, color: str, description: Optional[str] = None,
+                    age_start: Optional[int] = None, age_end: Optional[int] = None,
+                    is_active: bool = True, user_created: bool = True,
+                    created_at: Optional[str] = None, verbose: bool = False) -> Dict[str, Any]:
+    """Build a full activity JSON object from already normalized column values"""
+    if created_at is None:
+        created_at = datetime.now().isoformat()
+    
+    # Age range handling (ages arrive already parsed as whole numbers or None)
+    start = 0 if age_start is None else age_start
+    end = age_end
+    if end is not None and verbose:
+        print(f"Info: Setting flexible_end=False for {name} due to age_end={end}")
+    
+    # Share the default sub-dicts; only rows that differ get their own copy
+    if start == 0 and end is None:
+        age_range = _DEFAULT_AGE_RANGE
+    else:
+        age_range = {
+            "start": start,
+            "end": end,
+            "flexible_end": end is None  # Set flexible_end to False when age_end is specified
+        }
     
-    # Get category defaults
-    default_color = CATEGORY_COLORS.get(category, CATEGORY_COLORS['default'])
-    default_icon = DEFAULT_ICONS.get(category, DEFAULT_ICONS['default'])
+    display = _DISPLAY_BY_CATEGORY.get(category, _DISPLAY_BY_CATEGORY["default"])
+    if display["icon"] != icon or display["color"] != color:
+        display = {
+            "icon": icon,
+            "color": color
+        }
     
     # Build the activity object
     activity = {
@@ -121,65 +224,132 @@ def create_activity(row: pd.Series) -> Dict[str, Any]:
         "name": name,
         "category": category,
         "frequency": frequency,
-        "age_range": {
-            "start": 0,
-            "end": None,
-            "flexible_end": True
-        },
-        "display": {
-            "icon": default_icon,
-            "color": default_color
-        },
+        "age_range": age_range,
+        "display": display,
         "metadata": {
-            "user_created": True,  # Will be overridden below if CSV has user_created column
-            "is_active": True,    # Will be overridden below if CSV has is_active column
-            "created_at": datetime.now().isoformat(),
+            "user_created": user_created,
+            "is_active": is_active,
+            "created_at": created_at,
             "source": "csv_import"
         }
     }
     
     # Optional fields from CSV
-    if pd.notna(row.get('description')):
-        activity["description"] = str(row['description']).strip()
+    if description is not None:
+        activity["description"] = description
     
-    # Icon: use CSV value if provided, otherwise use category default
-    if pd.notna(row.get('icon')):
-        activity["display"]["icon"] = str(row['icon']).strip()
+    return activity
+
+
+def optional_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return an optional column as stripped text with None where the cell is empty"""
+    if column not in df.columns:
+        return pd.Series([None] * len(df), index=df.index, dtype=object)
     
-    # Age range handling
-    if pd.notna(row.get('age_start')):
-        try:
-            age_start = int(float(row['age_start']))  # Handle float strings from CSV
-            activity["age_range"]["start"] = age_start
-        except (ValueError, TypeError):
-            print(f"Warning: Invalid age_start '{row.get('age_start')}' for {name}, using default 0")
+    values = df[column]
+    return normalize_text(values).where(values.notna(), None)
+
+
+def age_column(df: pd.DataFrame, column: str, names: pd.Series, fallback: str) -> pd.Series:
+    """Parse an optional age column to whole numbers, with None where empty or invalid"""
+    if column not in df.columns:
+        return pd.Series([None] * len(df), index=df.index, dtype=object)
+    
+    raw = df[column]
+    ages = pd.to_numeric(raw, errors='coerce').astype(float)
+    # Infinite or too large for an int64 counts as invalid, like any unparseable cell
+    ages = ages.where(np.isfinite(ages) & (ages.abs() < _INT64_LIMIT))
+    
+    invalid = raw.notna() & ages.isna()
+    for value, name in zip(raw[invalid], names[invalid]):
+        print(f"Warning: Invalid {column} '{value}' for {name}, {fallback}")
+    
+    ages = np.trunc(ages).astype('Int64')  # Handle float strings from CSV
+    return ages.astype(object).where(ages.notna(), None)
+
+
+def create_activities(df: pd.DataFrame, created_at: str, verbose: bool = False) -> List[Dict[str, Any]]:
+    """Convert all rows to activity JSON objects, normalizing each column once"""
+    # Required fields
+    names = normalize_text(df['name'])
+    categories = normalize_text(df['category'], lower=True)
+    
+    # Generate IDs: lowercase, remove special chars, replace spaces with underscores
+    ids = (names.str.lower()
+           .str.replace(_ID_STRIP, '', regex=True)
+           .str.replace(_ID_GAP, '_', regex=True))
+    
+    # Parse frequency
+    times, periods = parse_frequencies(df['frequency'])
+    frequencies = [{"times": t, "period": p} for t, p in zip(times.tolist(), periods)]
+    
+    # Check optional column presence once; absent columns skip their work entirely
+    has = {col: col in df.columns for col in OPTIONAL_COLUMNS}
     
-    if pd.notna(row.get('age_end')):
+    # Icon: use CSV value if provided, otherwise use category default
+    icons = categories.map(DEFAULT_ICONS).fillna(DEFAULT_ICONS["default"])
+    if has['icon']:
+        csv_icons = optional_column(df, 'icon')
+        icons = np.where(csv_icons.notna(), csv_icons, icons)
+    
+    # Color: use CSV value if provided and not empty, otherwise use category default
+    colors = categories.map(CATEGORY_COLORS).fillna(CATEGORY_COLORS["default"])
+    if has['color']:
+        csv_colors = optional_column(df, 'color')
+        colors = np.where(csv_colors.notna() & (csv_colors != ''), csv_colors, colors)
+    
+    # is_active / user_created: proper boolean conversion, True when not in the CSV
+    is_active = np.full(len(df), True)
+    if has['is_active']:
+        csv_active = optional_column(df, 'is_active')
+        is_active = np.where(csv_active.notna(),
+                             csv_active.str.casefold().isin(_TRUE_ACTIVE), True)
+    
+    user_created = np.full(len(df), True)
+    if has['user_created']:
+        csv_user = optional_column(df, 'user_created')
+        user_created = np.where(csv_user.notna(),
+                                csv_user.str.casefold().isin(_TRUE_USER), True)
+    
+    # Columns in create_activity argument order, iterated as plain tuples
+    prepared = pd.DataFrame({
+        "name": names,
+        "category": categories,
+        "activity_id": ids,
+        "frequency": frequencies,
+        "icon": icons,
+        "color": colors,
+        "description": optional_column(df, 'description'),
+        "age_start": age_column(df, 'age_start', names, "using default 0"),
+        "age_end": age_column(df, 'age_end', names, "ignoring"),
+        "is_active": is_active,
+        "user_created": user_created
+    }, index=df.index)
+    
+    # Without --verbose only ~20 progress lines are shown
+    progress_every = 1 if verbose else max(1, len(df) // 20)
+    
+    activities = []
+    for idx, values in enumerate(prepared.itertuples(index=False, name=None)):
         try:
-            age_end = int(float(row['age_end']))  # Handle float strings from CSV
-            activity["age_range"]["end"] = age_end
-            activity["age_range"]["flexible_end"] = False  # Set flexible_end to False when age_end is specified
-            print(f"Info: Setting flexible_end=False for {name} due to age_end={age_end}")
-        except (ValueError, TypeError):
-            print(f"Warning: Invalid age_end '{row.get('age_end')}' for {name}, ignoring")
-    
-    # Color: use CSV value if provided, otherwise use category default
-    if pd.notna(row.get('color')):
-        color_value = str(row['color']).strip()
-        if color_value:  # Only use if not empty string
-            activity["display"]["color"] = color_value
-    
-    # is_active: read from CSV with proper boolean conversion
-    if pd.notna(row.get('is_active')):
-        is_active_value = str(row['is_active']).strip().lower()
-        activity["metadata"]["is_active"] = is_active_value in ['true', 'yes', '1', 'active', 'on']
-    
-    # user_created: read from CSV with proper boolean conversion
-    if pd.notna(row.get('user_created')):
-        user_created_value = str(row['user_created']).strip().lower()
-        activity["metadata"]["user_created"] = user_created_value in ['true', 'yes', '1', 'user', 'custom']
+            activity = create_activity(*values, created_at=created_at, verbose=verbose)
+            activities.append(activity)
+            
+            if idx % progress_every:
+                continue
+            
+            # Show detailed processing info
+            age_info = f"ages {activity['age_range']['start']}-{activity['age_range']['end'] or 'life'}"
+            flex_info = f"flexible_end={activity['age_range']['flexible_end']}"
+            active_info = f"active={activity['metadata']['is_active']}"
+            user_info = f"user_created={activity['metadata']['user_created']}"
+            
+            print(f"✓ Processed: {activity['name']} ({age_info}, {flex_info}, {active_info}, {user_info})")
+        except Exception as e:
+            print(f"✗ Error processing row {idx + 2}: {e}")
+            print(f"   Row data: {df.iloc[idx].to_dict()}")
     
-    return activity
+    return activities
 
 
 def read_from_google_sheets(sheet_url: str) -> pd.DataFrame:
@@ -193,7 +363,7 @@ def read_from_google_sheets(sheet_url: str) -> pd.DataFrame:
     csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
     
     try:
-        df = pd.read_csv(csv_url)
+        df = pd.read_csv(csv_url, **CSV_READ_OPTIONS)
         return df
     except Exception as e:
         print(f"Error reading from Google Sheets: {e}")
@@ -204,7 +374,7 @@ def read_from_google_sheets(sheet_url: str) -> pd.DataFrame:
 def read_from_csv(file_path: str) -> pd.DataFrame:
     """Read data from local CSV file"""
     try:
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(file_path, **CSV_READ_OPTIONS)
         return df
     except Exception as e:
         print(f"Error reading CSV file: {e}")
@@ -213,44 +383,50 @@ def read_from_csv(file_path: str) -> pd.DataFrame:
 
 def validate_data(df: pd.DataFrame) -> bool:
     """Validate that required columns exist and show column information"""
-    required_columns = ['name', 'category', 'frequency']
-    optional_columns = ['description', 'icon', 'age_start', 'age_end', 'color', 'is_active', 'user_created']
-    
     # Show all available columns
     print(f"Available columns: {list(df.columns)}")
     
     # Check required columns
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
     if missing_columns:
         print(f"Error: Missing required columns: {missing_columns}")
         return False
     
     # Show which optional columns are available
-    available_optional = [col for col in optional_columns if col in df.columns]
-    missing_optional = [col for col in optional_columns if col not in df.columns]
+    available_optional = [col for col in OPTIONAL_COLUMNS if col in df.columns]
+    missing_optional = [col for col in OPTIONAL_COLUMNS if col not in df.columns]
     
     if available_optional:
         print(f"Available optional columns: {available_optional}")
     if missing_optional:
         print(f"Missing optional columns (will use defaults): {missing_optional}")
     
-    # Check for empty required fields
-    for idx, row in df.iterrows():
-        if pd.isna(row['name']) or str(row['name']).strip() == '':
-            print(f"Error: Empty name at row {idx + 2}")  # +2 for header and 0-index
-            return False
-        if pd.isna(row['category']) or str(row['category']).strip() == '':
-            print(f"Error: Empty category at row {idx + 2}")
-            return False
-        if pd.isna(row['frequency']) or str(row['frequency']).strip() == '':
-            print(f"Error: Empty frequency at row {idx + 2}")
-            return False
+    # Check for empty required fields (first offending row, in column order)
+    empty = pd.DataFrame({
+        col: df[col].isna() | (df[col].astype(str).str.strip() == '')
+        for col in REQUIRED_COLUMNS
+    })
+    if empty.to_numpy().any():
+        idx = empty.any(axis=1).idxmax()
+        column = empty.loc[idx].idxmax()
+        print(f"Error: Empty {column} at row {idx + 2}")  # +2 for header and 0-index
+        return False
     
     return True
 
 
+@lru_cache(maxsize=None)
 def get_project_root() -> Path:
     """Find the project root directory"""
+    # Explicit override
+    if os.environ.get("VEGAN_CARDS_ROOT"):
+        return Path(os.environ["VEGAN_CARDS_ROOT"])
+    
+    # This script lives in <root>/scripts/
+    root = Path(__file__).resolve().parent.parent
+    if (root / "package.json").exists() or (root / "src").exists():
+        return root
+    
     current = Path.cwd()
     # Look for package.json or src directory as indicators
     while current.parent != current:
@@ -260,14 +436,14 @@ def get_project_root() -> Path:
     return Path.cwd()  # fallback to current directory
 
 
-def create_output_structure(activities: List[Dict[str, Any]]) -> Dict[str, Any]:
+def create_output_structure(activities: List[Dict[str, Any]], created_at: str) -> Dict[str, Any]:
     """Wrap activities in the proper JSON structure with metadata"""
     return {
         "activities": activities,
         "metadata": {
             "version": "2.0",
-            "created_at": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
+            "created_at": created_at,
+            "last_updated": created_at,
             "total_activities": len(activities),
             "source": "csv_import",
             "generated_by": "convert_activities_in_sheets_to_JSON.py"
@@ -275,13 +451,32 @@ def create_output_structure(activities: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def serialize_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_json_stream(output_data: Dict[str, Any], f) -> None:
+    """Write the output structure one activity at a time, same layout as serialize_json"""
+    activities = output_data["activities"]
+    f.write(b'{\n  "activities": [')
+    for i, activity in enumerate(activities):
+        f.write(b'\n    ' if i == 0 else b',\n    ')
+        f.write(serialize_json(activity).replace(b'\n', b'\n    '))
+    f.write(b'\n  ],\n  "metadata": ' if activities else b'],\n  "metadata": ')
+    f.write(serialize_json(output_data["metadata"]).replace(b'\n', b'\n  '))
+    f.write(b'\n}')
+
+
 def backup_file(filepath: Path) -> Optional[Path]:
     """Create a backup of an existing file"""
     if not filepath.exists():
         return None
     
     backup_path = filepath.with_suffix(f".backup.{int(datetime.now().timestamp())}.json")
-    shutil.copy2(filepath, backup_path)
+    shutil.copy2(filepath, backup_path)  # uses os.sendfile / fcopyfile where available
     print(f"Backed up existing file to: {backup_path}")
     return backup_path
 
@@ -313,6 +508,7 @@ Examples:
     parser.add_argument('--output-dir', help='Output directory (default: src/data/activities/)')
     parser.add_argument('--dry-run', action='store_true', help='Print output instead of writing file')
     parser.add_argument('--no-backup', action='store_true', help='Skip backup when overwriting files')
+    parser.add_argument('--verbose', action='store_true', help='Show every processed row and age_end info (default: about 20 progress lines)')
     
     return parser.parse_args()
 
@@ -324,6 +520,9 @@ def main():
     print("Activities JSON Generator")
     print("=" * 50)
     
+    # Single timestamp shared by every activity and the output metadata
+    now_iso = datetime.now().isoformat()
+    
     # Determine project root and output directory
     project_root = get_project_root()
     print(f"Project root: {project_root}")
@@ -358,23 +557,8 @@ def main():
     if not validate_data(df):
         return
     
-    # Convert each row to an activity
-    activities = []
-    for idx, row in df.iterrows():
-        try:
-            activity = create_activity(row)
-            activities.append(activity)
-            
-            # Show detailed processing info
-            age_info = f"ages {activity['age_range']['start']}-{activity['age_range']['end'] or 'life'}"
-            flex_info = f"flexible_end={activity['age_range']['flexible_end']}"
-            active_info = f"active={activity['metadata']['is_active']}"
-            user_info = f"user_created={activity['metadata']['user_created']}"
-            
-            print(f"✓ Processed: {activity['name']} ({age_info}, {flex_info}, {active_info}, {user_info})")
-        except Exception as e:
-            print(f"✗ Error processing row {idx + 2}: {e}")
-            print(f"   Row data: {dict(row)}")
+    # Convert all rows to activities
+    activities = create_activities(df, now_iso, verbose=args.verbose)
     
     # Output results
     print("\n" + "=" * 50)
@@ -392,7 +576,7 @@ def main():
     print(f"  - Output format: Full JSON structure with metadata wrapper")
     
     # Create proper JSON structure
-    output_data = create_output_structure(activities)
+    output_data = create_output_structure(activities, now_iso)
     
     # Determine output file
     if args.replace_default:
@@ -407,7 +591,9 @@ def main():
         print("\n" + "=" * 50)
         print("DRY RUN - JSON Output:")
         print("-" * 50)
-        print(json.dumps(output_data, indent=2, ensure_ascii=False))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(serialize_json(output_data) + b"\n")
+        sys.stdout.flush()
         return
     
     # Create output directory if it doesn't exist
@@ -419,8 +605,11 @@ def main():
     
     # Write the file
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            if len(activities) > STREAM_THRESHOLD:
+                write_json_stream(output_data, f)
+            else:
+                f.write(serialize_json(output_data))
         
         print(f"\n✅ JSON saved to: {output_file}")
         
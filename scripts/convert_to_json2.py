@@ -4,17 +4,29 @@ Activities JSON Generator with Types Support
 Handles experiential, financial, and quote activity types
 """
 
+import csv
+import io
 import json
 import sys
 import re
 import os
 import shutil
 import argparse
+import requests
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import pandas as pd
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
 # For Google Sheets integration
 GOOGLE_SHEETS_URL = "https://docs.google.com/spreadsheets/d/138_Jq0OGLWXbtP3Qz8ZRrt94VO8u75tcrEzJAz-f50Q/edit?usp=sharing"
 
@@ -27,7 +39,7 @@ TAB_GIDS = {
 
 
 # Smart defaults by category
-CATEGORY_COLORS = {
+CATEGORY_COLORS = MappingProxyType({
     "celebration": "#FFD700",
     "nature": "#FF6347",
     "routine": "#4A90E2",
@@ -46,9 +58,9 @@ CATEGORY_COLORS = {
     "financial": "#10B981",
     "reflection": "#8B5CF6",
     "default": "#95A5A6"
-}
+})
 
-DEFAULT_ICONS = {
+DEFAULT_ICONS = MappingProxyType({
     "celebration": "🎉",
     "nature": "🌳",
     "routine": "☕",
@@ -67,10 +79,10 @@ DEFAULT_ICONS = {
     "financial": "💰",
     "reflection": "💭",
     "default": "⭐"
-}
+})
 
 # Type-specific defaults
-TYPE_DEFAULTS = {
+TYPE_DEFAULTS = MappingProxyType({
     "experiential": {
         "display_format": "occurrences"  # Show remaining count
     },
@@ -82,7 +94,29 @@ TYPE_DEFAULTS = {
         "display_format": "text",        # Show the quote
         "frequency": {"times": 1, "period": "year"}  # Default annual reminder
     }
-}
+})
+
+# Precomputed fallbacks and per-type display formats
+_DEFAULT_COLOR = CATEGORY_COLORS["default"]
+_DEFAULT_ICON = DEFAULT_ICONS["default"]
+_DISPLAY_FORMAT = MappingProxyType({k: v["display_format"] for k, v in TYPE_DEFAULTS.items()})
+
+# Columns read from the sheet; anything else is dropped while parsing
+REQUIRED_COLUMNS = ['name', 'category']  # type is optional for backward compatibility
+OPTIONAL_COLUMNS = ['description', 'icon', 'age_start', 'age_end', 'color', 'is_active', 'user_created', 'type', 'frequency', 'amount', 'unit', 'currency']
+KNOWN_COLUMNS = frozenset(REQUIRED_COLUMNS + OPTIONAL_COLUMNS)
+
+# A sheet as read: its kept header columns and the row dicts
+SheetData = Tuple[List[str], List[Dict[str, str]]]
+
+# Rows between progress lines when --verbose is off
+PROGRESS_EVERY = 500
+
+# Shared by every activity without its own ages; copied before being changed
+_DEFAULT_AGE_RANGE = {"start": 0, "end": None, "flexible_end": True}
+
+# Integers must fit in 64 bits (orjson refuses anything wider)
+_INT64_LIMIT = 2 ** 63
 
 
 def get_sheet_id_and_gid(url):
@@ -93,37 +127,58 @@ def get_sheet_id_and_gid(url):
     return sheet_id
 
 
+# Precompiled patterns for ID generation and frequency parsing
+_ID_STRIP = re.compile(r'[^\w\s-]')
+_ID_SEP = re.compile(r'[-\s]+')
+_FREQ = re.compile(r'(\d+)\s*/\s*(year|month|week|day)')
+
+# ASCII translation table equivalent to _ID_STRIP (delete) and _ID_SEP (mark with '-')
+_ID_ASCII_TABLE = str.maketrans({
+    c: None if _ID_STRIP.match(c) else '-'
+    for c in map(chr, range(128))
+    if _ID_STRIP.match(c) or _ID_SEP.match(c)
+})
+_ID_DASHES = re.compile(r'-+')
+
+# Frequency special cases
+FREQUENCY_MAP = {
+    'daily': {"times": 365, "period": "year"},
+    'everyday': {"times": 365, "period": "year"},
+    'every day': {"times": 365, "period": "year"},
+    'weekly': {"times": 52, "period": "year"},
+    'every week': {"times": 52, "period": "year"},
+    'monthly': {"times": 12, "period": "year"},
+    'every month': {"times": 12, "period": "year"},
+    'yearly': {"times": 1, "period": "year"},
+    'annually': {"times": 1, "period": "year"},
+    'every year': {"times": 1, "period": "year"}
+}
+
+
 def generate_id(name: str) -> str:
     """Generate a valid ID from the activity name"""
     id_str = name.lower().strip()
-    id_str = re.sub(r'[^\w\s-]', '', id_str)
-    id_str = re.sub(r'[-\s]+', '_', id_str)
-    return id_str
-
-
-def parse_frequency(freq_str: str) -> Dict[str, Any]:
-    """Parse frequency string like '1/year', '52/year', '1/week', '365/year'"""
+    if id_str.isascii():
+        # ASCII fast path: one translate pass, then collapse the separator runs
+        return _ID_DASHES.sub('_', id_str.translate(_ID_ASCII_TABLE))
+    return _ID_SEP.sub('_', _ID_STRIP.sub('', id_str))
+
+
+@lru_cache(maxsize=256)
+def parse_frequency(freq_str: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse frequency string like '1/year', '52/year', '1/week', '365/year'
+    Returns None if it can't be parsed (the caller warns, so every bad row is reported)
+    Results are cached and shared between activities, so treat them as read-only
+    """
     freq_str = freq_str.strip().lower()
     
     # Handle special cases
-    frequency_map = {
-        'daily': {"times": 365, "period": "year"},
-        'everyday': {"times": 365, "period": "year"},
-        'every day': {"times": 365, "period": "year"},
-        'weekly': {"times": 52, "period": "year"},
-        'every week': {"times": 52, "period": "year"},
-        'monthly': {"times": 12, "period": "year"},
-        'every month': {"times": 12, "period": "year"},
-        'yearly': {"times": 1, "period": "year"},
-        'annually': {"times": 1, "period": "year"},
-        'every year': {"times": 1, "period": "year"}
-    }
-    
-    if freq_str in frequency_map:
-        return frequency_map[freq_str]
+    if freq_str in FREQUENCY_MAP:
+        return FREQUENCY_MAP[freq_str]
     
     # Parse format like "1/year" or "52/year"
-    match = re.match(r'(\d+)\s*/\s*(year|month|week|day)', freq_str)
+    match = _FREQ.match(freq_str)
     if match:
         times = int(match.group(1))
         period = match.group(2)
@@ -138,39 +193,76 @@ def parse_frequency(freq_str: str) -> Dict[str, Any]:
         elif period == "day":
             times = times * 365
             period = "year"
-            
-        return {"times": times, "period": period}
+        
+        if times < _INT64_LIMIT:
+            return {"times": times, "period": period}
     
-    # Default fallback
-    print(f"Warning: Could not parse frequency '{freq_str}', defaulting to 1/year")
-    return {"times": 1, "period": "year"}
+    return None
+
 
+def parse_age(age_str: str) -> int:
+    """Parse an age cell (float strings from CSV allowed); raises ValueError if out of int64 range"""
+    age = int(float(age_str))
+    if not -_INT64_LIMIT <= age < _INT64_LIMIT:
+        raise ValueError(f"age out of range: {age_str}")
+    return age
 
-def create_activity(row: pd.Series) -> Dict[str, Any]:
-    """Convert a CSV row to a full activity JSON object"""
+
+def _has(row: Dict[str, str], key: str) -> bool:
+    """True if the row has a non-empty value for key"""
+    value = row.get(key)
+    return value is not None and value != ''
+
+
+def _norm(value: Optional[str], lower: bool = False) -> str:
+    """Strip a cell value (None becomes ''), optionally lowercasing it"""
+    value = str(value or '').strip()
+    return value.lower() if lower else value
+
+
+def create_activity(row: Dict[str, str], created_at: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Convert a CSV row to a full activity JSON object
+    Raises ValueError for rows that fail validation
+    """
+    if created_at is None:
+        created_at = datetime.now().isoformat()
+    
     # Required fields
-    name = str(row['name']).strip()
-    category = str(row['category']).strip().lower()
+    name = _norm(row.get('name'))
+    if not name:
+        raise ValueError("Empty name")
+    category = _norm(row.get('category'), lower=True)
+    if not category:
+        raise ValueError(f"Empty category for '{name}'")
+    category = sys.intern(category)  # repeated across many rows
     
     # Get type (default to experiential for backward compatibility)
-    activity_type = str(row.get('type', 'experiential')).strip().lower()
+    activity_type = _norm(row.get('type') or 'experiential', lower=True)
     if activity_type not in TYPE_DEFAULTS:
         print(f"Warning: Unknown type '{activity_type}' for {name}, defaulting to 'experiential'")
         activity_type = 'experiential'
+    activity_type = sys.intern(activity_type)
+    
+    # Description is used by both the quote and common optional fields
+    description = _norm(row['description']) if _has(row, 'description') else None
     
     # Generate ID
     activity_id = generate_id(name)
     
     # Parse frequency (quotes have a default)
-    if activity_type == 'quote' and pd.isna(row.get('frequency')):
+    if activity_type == 'quote' and not _has(row, 'frequency'):
         frequency = TYPE_DEFAULTS['quote']['frequency']
     else:
-        frequency_str = str(row.get('frequency', '1/year')).strip()
+        frequency_str = _norm(row.get('frequency') or '1/year')
         frequency = parse_frequency(frequency_str)
+        if frequency is None:
+            print(f"Warning: Could not parse frequency '{frequency_str.lower()}', defaulting to 1/year")
+            frequency = {"times": 1, "period": "year"}
     
     # Get category defaults
-    color = CATEGORY_COLORS.get(category, CATEGORY_COLORS['default'])
-    default_icon = DEFAULT_ICONS.get(category, DEFAULT_ICONS['default'])
+    color = CATEGORY_COLORS.get(category, _DEFAULT_COLOR)
+    default_icon = DEFAULT_ICONS.get(category, _DEFAULT_ICON)
     
     # Build the base activity object
     activity = {
@@ -179,20 +271,16 @@ def create_activity(row: pd.Series) -> Dict[str, Any]:
         "type": activity_type,
         "category": category,
         "frequency": frequency,
-        "age_range": {
-            "start": 0,
-            "end": None,
-            "flexible_end": True
-        },
+        "age_range": _DEFAULT_AGE_RANGE,
         "display": {
             "icon": default_icon,
             "color": color,
-            "format": TYPE_DEFAULTS[activity_type]["display_format"]
+            "format": _DISPLAY_FORMAT[activity_type]
         },
         "metadata": {
             "user_created": True,  # Will be overridden below if CSV has user_created column
             "is_active": True,    # Will be overridden below if CSV has is_active column
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at,
             "source": "csv_import"
         }
     }
@@ -200,11 +288,20 @@ def create_activity(row: pd.Series) -> Dict[str, Any]:
     # Add type-specific data
     if activity_type == "financial":
         # Financial activities need amount, unit, and currency
-        if pd.notna(row.get('amount')):
+        if _has(row, 'amount'):
+            try:
+                amount = float(row['amount'])
+            except ValueError:
+                raise ValueError(f"Invalid amount '{row['amount']}' for '{name}'")
+            
+            currency = sys.intern(_norm(row.get('currency') or 'USD').upper())
+            if len(currency) != 3:
+                print(f"Warning: Currency '{currency}' for '{name}' should be 3-letter code (e.g., USD, EUR)")
+            
             financial_data = {
-                "amount": float(row['amount']),
-                "unit": str(row.get('unit', 'occurrence')).strip(),
-                "currency": str(row.get('currency', 'USD')).strip().upper()
+                "amount": amount,
+                "unit": sys.intern(_norm(row.get('unit') or 'occurrence')),
+                "currency": currency
             }
             activity["financial"] = financial_data
         else:
@@ -212,118 +309,114 @@ def create_activity(row: pd.Series) -> Dict[str, Any]:
     
     elif activity_type == "quote":
         # Quotes might have author information in description
-        if pd.notna(row.get('description')):
-            desc = str(row['description']).strip()
+        if description is not None:
             # Check if author is included (format: "Quote text - Author")
-            if ' - ' in desc:
-                quote_parts = desc.rsplit(' - ', 1)
+            text, sep, author = description.rpartition(' - ')
+            if sep:
                 activity["quote"] = {
-                    "text": quote_parts[0],
-                    "author": quote_parts[1]
+                    "text": text,
+                    "author": author
                 }
-                activity["description"] = desc  # Keep full description too
+                activity["description"] = description  # Keep full description too
             else:
-                activity["quote"] = {"text": desc}
-                activity["description"] = desc
+                activity["quote"] = {"text": description}
+                activity["description"] = description
     
     # Common optional fields
-    if pd.notna(row.get('description')) and activity_type != "quote":
-        activity["description"] = str(row['description']).strip()
+    if description is not None and activity_type != "quote":
+        activity["description"] = description
     
-    if pd.notna(row.get('icon')):
-        activity["display"]["icon"] = str(row['icon']).strip()
+    if _has(row, 'icon'):
+        activity["display"]["icon"] = _norm(row['icon'])
     
-    if pd.notna(row.get('age_start')):
+    if _has(row, 'age_start') or _has(row, 'age_end'):
+        activity["age_range"] = dict(_DEFAULT_AGE_RANGE)
+    
+    if _has(row, 'age_start'):
         try:
-            activity["age_range"]["start"] = int(row['age_start'])
-        except ValueError:
+            activity["age_range"]["start"] = parse_age(row['age_start'])
+        except (ValueError, OverflowError):
             print(f"Warning: Invalid age_start for {name}")
     
-    if pd.notna(row.get('age_end')):
+    if _has(row, 'age_end'):
         try:
-            activity["age_range"]["end"] = int(row['age_end'])
+            activity["age_range"]["end"] = parse_age(row['age_end'])
             activity["age_range"]["flexible_end"] = False
-        except ValueError:
+        except (ValueError, OverflowError):
             print(f"Warning: Invalid age_end for {name}")
     
-    if pd.notna(row.get('color')):
-        activity["display"]["color"] = str(row['color']).strip()
+    if _has(row, 'color'):
+        activity["display"]["color"] = _norm(row['color'])
     
-    if pd.notna(row.get('is_active')):
+    if _has(row, 'is_active'):
         activity["metadata"]["is_active"] = str(row['is_active']).lower() in ['true', 'yes', '1']
     
-    if pd.notna(row.get('user_created')):
+    if _has(row, 'user_created'):
         activity["metadata"]["user_created"] = str(row['user_created']).lower() in ['true', 'yes', '1']
     
     return activity
 
 
-def validate_data(df: pd.DataFrame) -> bool:
-    """Validate that required columns exist and have valid data"""
-    required_columns = ['name', 'category']  # type is optional for backward compatibility
-    optional_columns = ['description', 'icon', 'age_start', 'age_end', 'color', 'is_active', 'user_created', 'type', 'frequency', 'amount', 'unit', 'currency']
+def validate_data(columns: List[str]) -> bool:
+    """Validate that required columns exist (row values are checked in create_activity)"""
+    column_set = set(columns)
     
     # Show all available columns
-    print(f"Available columns: {list(df.columns)}")
+    print(f"Available columns: {columns}")
     
     # Check required columns
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in column_set]
     if missing_columns:
         print(f"Error: Missing required columns: {missing_columns}")
         return False
     
     # Show which optional columns are available
-    available_optional = [col for col in optional_columns if col in df.columns]
-    missing_optional = [col for col in optional_columns if col not in df.columns]
+    available_optional = [col for col in OPTIONAL_COLUMNS if col in column_set]
+    missing_optional = [col for col in OPTIONAL_COLUMNS if col not in column_set]
     
     if available_optional:
         print(f"Available optional columns: {available_optional}")
     if missing_optional:
         print(f"Missing optional columns (will use defaults): {missing_optional}")
     
-    # Check for empty required fields
-    errors = 0
-    for idx, row in df.iterrows():
-        if pd.isna(row['name']) or str(row['name']).strip() == '':
-            print(f"Error: Empty name at row {idx + 2}")  # +2 for header and 0-index
-            errors += 1
-            continue
-            
-        if pd.isna(row['category']) or str(row['category']).strip() == '':
-            print(f"Error: Empty category at row {idx + 2}")
-            errors += 1
-            continue
-        
-        # Type-specific validation
-        if pd.notna(row.get('type')):
-            activity_type = str(row['type']).strip().lower()
-            
-            if activity_type == 'financial':
-                if pd.isna(row.get('amount')):
-                    print(f"Warning: Financial activity '{row['name']}' at row {idx + 2} missing amount")
-                else:
-                    try:
-                        float(row['amount'])
-                    except ValueError:
-                        print(f"Error: Invalid amount '{row.get('amount')}' for '{row['name']}' at row {idx + 2}")
-                        errors += 1
-                        continue
-                        
-                # Validate currency format
-                if pd.notna(row.get('currency')):
-                    currency = str(row['currency']).strip().upper()
-                    if len(currency) != 3:
-                        print(f"Warning: Currency '{currency}' for '{row['name']}' should be 3-letter code (e.g., USD, EUR)")
+    return True
+
+
+def read_csv_rows(stream) -> SheetData:
+    """
+    Parse CSV text into a list of row dicts keyed by the header, keeping only the known columns
+    Returns the kept header columns along with the rows
+    """
+    reader = csv.reader(stream)
+    header = next(reader, [])
+    keep = [(i, col) for i, col in enumerate(header) if col in KNOWN_COLUMNS]
     
-    if errors > 0:
-        print(f"\\nValidation failed with {errors} errors. Please fix the issues above.")
-        return False
+    ignored = [col for col in header if col not in KNOWN_COLUMNS]
+    if ignored:
+        print(f"Ignoring unknown columns: {ignored}")
     
-    print(f"\\n✓ Validation passed for {len(df)} activities")
-    return True
+    rows = []
+    for cells in reader:
+        if not cells:
+            continue
+        # Short rows leave the missing cells as None, as csv.DictReader would
+        count = len(cells)
+        rows.append({col: cells[i] if i < count else None for i, col in keep})
+    return list(dict.fromkeys(col for _, col in keep)), rows
+
+
+_SESSION = None
+
 
+def get_session() -> requests.Session:
+    """Return the shared requests session, so downloads reuse kept-alive connections"""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+    return _SESSION
 
-def read_from_google_sheets_tab(sheet_url: str, tab_name: str = None, gid: str = None) -> pd.DataFrame:
+
+def read_from_google_sheets_tab(sheet_url: str, tab_name: str = None, gid: str = None) -> Optional[SheetData]:
     """Read data from a specific Google Sheets tab"""
     if '/edit' in sheet_url:
         sheet_id = sheet_url.split('/d/')[1].split('/')[0]
@@ -341,10 +434,15 @@ def read_from_google_sheets_tab(sheet_url: str, tab_name: str = None, gid: str =
     csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={tab_gid}"
     
     try:
-        df = pd.read_csv(csv_url)
+        with get_session().get(csv_url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            # Parse straight off the socket (gzip/deflate decoded) while the body downloads
+            response.raw.decode_content = True
+            response.raw.auto_close = False  # let TextIOWrapper see EOF rather than a closed file
+            columns, rows = read_csv_rows(io.TextIOWrapper(response.raw, encoding='utf-8-sig', newline=''))
         tab_info = f"tab '{tab_name}'" if tab_name else f"GID {tab_gid}"
-        print(f"✓ Successfully read {len(df)} rows from {tab_info}")
-        return df
+        print(f"✓ Successfully read {len(rows)} rows from {tab_info}")
+        return columns, rows
     except Exception as e:
         tab_info = f"tab '{tab_name}'" if tab_name else f"GID {tab_gid}"
         print(f"✗ Error reading from Google Sheets {tab_info}: {e}")
@@ -352,56 +450,63 @@ def read_from_google_sheets_tab(sheet_url: str, tab_name: str = None, gid: str =
         return None
 
 
-def read_from_google_sheets(sheet_url: str) -> pd.DataFrame:
+def read_from_google_sheets(sheet_url: str) -> Optional[SheetData]:
     """Read data from Google Sheets - backward compatibility function"""
     return read_from_google_sheets_tab(sheet_url, tab_name='Experiences')
 
 
-def read_from_google_sheets_multi_tab(sheet_url: str) -> pd.DataFrame:
+def read_from_google_sheets_multi_tab(sheet_url: str) -> Optional[SheetData]:
     """Read data from both Experiences and Financial tabs and combine them"""
     print("Reading from multiple Google Sheets tabs...")
     
-    # Read from Experiences tab
-    experiences_df = read_from_google_sheets_tab(sheet_url, tab_name='Experiences')
-    
-    # Read from Financial tab
-    financial_df = read_from_google_sheets_tab(sheet_url, tab_name='Financial')
-    
-    # Combine the dataframes
-    combined_dfs = []
-    
-    if experiences_df is not None:
-        print(f"✓ Experiences tab: {len(experiences_df)} activities")
-        combined_dfs.append(experiences_df)
+    # Download the Experiences and Financial tabs in parallel
+    tabs = ['Experiences', 'Financial']
+    get_session()  # create the shared session before both workers ask for it
+    with ThreadPoolExecutor(max_workers=len(tabs)) as executor:
+        futures = {name: executor.submit(read_from_google_sheets_tab, sheet_url, tab_name=name) for name in tabs}
+    experiences = futures['Experiences'].result()
+    financial = futures['Financial'].result()
+    
+    # Columns across the tabs (they may have different headers)
+    columns = {}
+    tab_rows = []
+    
+    if experiences is not None:
+        experiences_columns, experiences_rows = experiences
+        print(f"✓ Experiences tab: {len(experiences_rows)} activities")
+        columns.update(dict.fromkeys(experiences_columns))
+        tab_rows.append(experiences_rows)
     else:
         print("✗ Could not read Experiences tab")
     
-    if financial_df is not None:
+    if financial is not None:
+        financial_columns, financial_rows = financial
         # Ensure all activities from Financial tab have type='financial'
-        financial_df = financial_df.copy()
-        financial_df['type'] = 'financial'
-        print(f"✓ Financial tab: {len(financial_df)} activities (auto-set type='financial')")
-        combined_dfs.append(financial_df)
+        for row in financial_rows:
+            row['type'] = 'financial'
+        print(f"✓ Financial tab: {len(financial_rows)} activities (auto-set type='financial')")
+        columns.update(dict.fromkeys(financial_columns + ['type']))
+        tab_rows.append(financial_rows)
     else:
         print("✗ Could not read Financial tab")
     
     # If no tabs were read successfully, return None
-    if not combined_dfs:
+    if not tab_rows:
         print("✗ No tabs could be read successfully")
         return None
     
-    # Combine all dataframes
-    combined_df = pd.concat(combined_dfs, ignore_index=True)
-    print(f"✓ Combined total: {len(combined_df)} activities from {len(combined_dfs)} tabs")
+    # Chain the tabs' rows together; a single tab is returned as is
+    combined_rows = tab_rows[0] if len(tab_rows) == 1 else list(chain.from_iterable(tab_rows))
+    print(f"✓ Combined total: {len(combined_rows)} activities from {len(tab_rows)} tabs")
     
-    return combined_df
+    return list(columns), combined_rows
 
 
-def read_from_csv(file_path: str) -> pd.DataFrame:
+def read_from_csv(file_path: str) -> Optional[SheetData]:
     """Read data from local CSV file"""
     try:
-        df = pd.read_csv(file_path)
-        return df
+        with open(file_path, newline='', encoding='utf-8-sig') as f:
+            return read_csv_rows(f)
     except Exception as e:
         print(f"Error reading CSV file: {e}")
         return None
@@ -409,16 +514,38 @@ def read_from_csv(file_path: str) -> pd.DataFrame:
 
 def generate_summary(activities: List[Dict[str, Any]]) -> None:
     """Print a comprehensive summary of generated activities by type and source"""
-    # Count by type
-    type_counts = {}
-    category_counts = {}
+    # Gather every statistic in a single pass over the activities
+    type_counts = Counter()
+    category_counts = Counter()
+    financial_activities = []
+    quote_activities = []
+    total_amounts = {}
+    active_count = 0
+    user_created_count = 0
+    with_age_end_count = 0
+    activities_with_description = 0
+    activities_with_custom_icon = 0
     
     for activity in activities:
         activity_type = activity.get('type', 'experiential')
-        type_counts[activity_type] = type_counts.get(activity_type, 0) + 1
+        type_counts[activity_type] += 1
         
         category = activity.get('category', 'unknown')
-        category_counts[category] = category_counts.get(category, 0) + 1
+        category_counts[category] += 1
+        
+        if activity_type == 'financial':
+            financial_activities.append(activity)
+            if 'financial' in activity:
+                currency = activity['financial']['currency']
+                total_amounts[currency] = total_amounts.get(currency, 0) + activity['financial']['amount']
+        elif activity_type == 'quote':
+            quote_activities.append(activity)
+        
+        active_count += bool(activity['metadata']['is_active'])
+        user_created_count += bool(activity['metadata']['user_created'])
+        with_age_end_count += activity['age_range']['end'] is not None
+        activities_with_description += bool(activity.get('description'))
+        activities_with_custom_icon += activity.get('display', {}).get('icon') != DEFAULT_ICONS.get(activity.get('category', 'default'), _DEFAULT_ICON)
     
     print("\n" + "=" * 60)
     print("ACTIVITY SUMMARY")
@@ -434,27 +561,15 @@ def generate_summary(activities: List[Dict[str, Any]]) -> None:
     # Summary by Category (top 10)
     print("\nBy Category (Top 10):")
     print("-" * 30)
-    sorted_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
-    for category, count in sorted_categories[:10]:
+    for category, count in category_counts.most_common(10):
         percentage = (count / len(activities)) * 100
         print(f"{category.capitalize()}: {count} activities ({percentage:.1f}%)")
     
     # Financial Activities Detail
-    financial_activities = [a for a in activities if a.get('type') == 'financial']
     if financial_activities:
         print("\nFinancial Activities Detail:")
         print("-" * 30)
         
-        # Calculate total financial impact
-        total_amounts = {}
-        for activity in financial_activities:
-            if 'financial' in activity:
-                currency = activity['financial']['currency']
-                amount = activity['financial']['amount']
-                if currency not in total_amounts:
-                    total_amounts[currency] = 0
-                total_amounts[currency] += amount
-        
         print(f"Total financial activities: {len(financial_activities)}")
         for currency, total in sorted(total_amounts.items()):
             print(f"Total {currency}: {total:,.2f}")
@@ -470,7 +585,6 @@ def generate_summary(activities: List[Dict[str, Any]]) -> None:
             print(f"  ... and {len(financial_activities) - 5} more")
     
     # Quote Activities
-    quote_activities = [a for a in activities if a.get('type') == 'quote']
     if quote_activities:
         print(f"\nQuote Activities: {len(quote_activities)} found")
         print("-" * 30)
@@ -483,10 +597,6 @@ def generate_summary(activities: List[Dict[str, Any]]) -> None:
             print(f"  ... and {len(quote_activities) - 3} more")
     
     # Overall Statistics
-    active_count = sum(1 for a in activities if a['metadata']['is_active'])
-    user_created_count = sum(1 for a in activities if a['metadata']['user_created'])
-    with_age_end_count = sum(1 for a in activities if a['age_range']['end'] is not None)
-    
     print(f"\nOverall Statistics:")
     print("-" * 30)
     print(f"  • Total activities: {len(activities)}")
@@ -498,9 +608,6 @@ def generate_summary(activities: List[Dict[str, Any]]) -> None:
     # Data Quality Summary
     print(f"\nData Quality:")
     print("-" * 30)
-    activities_with_description = sum(1 for a in activities if a.get('description'))
-    activities_with_custom_icon = sum(1 for a in activities if a.get('display', {}).get('icon') != DEFAULT_ICONS.get(a.get('category', 'default'), DEFAULT_ICONS['default']))
-    
     print(f"  • Activities with descriptions: {activities_with_description}/{len(activities)} ({(activities_with_description/len(activities)*100):.1f}%)")
     print(f"  • Activities with custom icons: {activities_with_custom_icon}/{len(activities)} ({(activities_with_custom_icon/len(activities)*100):.1f}%)")
     print(f"  • Categories represented: {len(category_counts)}")
@@ -518,14 +625,14 @@ def get_project_root() -> Path:
     return Path.cwd()  # fallback to current directory
 
 
-def create_output_structure(activities: List[Dict[str, Any]]) -> Dict[str, Any]:
+def create_output_structure(activities: List[Dict[str, Any]], created_at: str) -> Dict[str, Any]:
     """Wrap activities in the proper JSON structure with metadata"""
     return {
         "activities": activities,
         "metadata": {
             "version": "2.0",
-            "created_at": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
+            "created_at": created_at,
+            "last_updated": created_at,
             "total_activities": len(activities),
             "source": "csv_import",
             "generated_by": "convert_to_json2.py"
@@ -533,13 +640,39 @@ def create_output_structure(activities: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def serialize_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_json_stream(output_data: Dict[str, Any], f) -> int:
+    """
+    Write the output structure one activity at a time, same layout as serialize_json
+    Returns the number of bytes written
+    """
+    activities = output_data["activities"]
+    written = f.write(b'{\n  "activities": [')
+    for i, activity in enumerate(activities):
+        written += f.write(b'\n    ' if i == 0 else b',\n    ')
+        written += f.write(serialize_json(activity).replace(b'\n', b'\n    '))
+    written += f.write(b'\n  ],\n  "metadata": ' if activities else b'],\n  "metadata": ')
+    written += f.write(serialize_json(output_data["metadata"]).replace(b'\n', b'\n  '))
+    written += f.write(b'\n}')
+    return written
+
+
 def backup_file(filepath: Path) -> Optional[Path]:
-    """Create a backup of an existing file"""
+    """Create a backup of an existing file (a hard link, as the caller replaces rather than rewrites it)"""
     if not filepath.exists():
         return None
     
     backup_path = filepath.with_suffix(f".backup.{int(datetime.now().timestamp())}.json")
-    shutil.copy2(filepath, backup_path)
+    try:
+        os.link(filepath, backup_path)
+    except OSError:
+        shutil.copy2(filepath, backup_path)
     print(f"Backed up existing file to: {backup_path}")
     return backup_path
 
@@ -562,6 +695,9 @@ Examples:
   
   # Dry run to test
   python scripts/convert_to_json2.py --dry-run
+  
+  # List every processed activity
+  python scripts/convert_to_json2.py --verbose
 '''
     )
     
@@ -571,6 +707,7 @@ Examples:
     parser.add_argument('--output-dir', help='Output directory (default: src/data/activities/)')
     parser.add_argument('--dry-run', action='store_true', help='Print output instead of writing file')
     parser.add_argument('--no-backup', action='store_true', help='Skip backup when overwriting files')
+    parser.add_argument('--verbose', action='store_true', help=f'Show every processed row (default: progress every {PROGRESS_EVERY} rows)')
     
     return parser.parse_args()
 
@@ -582,6 +719,9 @@ def main():
     print("Activities JSON Generator with Types Support")
     print("=" * 50)
     
+    # Single timestamp shared by every activity and the output metadata
+    now_iso = datetime.now().isoformat()
+    
     # Determine project root and output directory
     project_root = get_project_root()
     print(f"Project root: {project_root}")
@@ -596,37 +736,49 @@ def main():
     # Choose input source
     if args.csv_file:
         # Use command line argument as CSV file path
-        df = read_from_csv(args.csv_file)
+        sheet = read_from_csv(args.csv_file)
     else:
         # Try to read from Google Sheets (both Experiences and Financial tabs)
         if GOOGLE_SHEETS_URL != "YOUR_GOOGLE_SHEETS_URL_HERE":
             print(f"Reading from Google Sheets...")
-            df = read_from_google_sheets_multi_tab(GOOGLE_SHEETS_URL)
+            sheet = read_from_google_sheets_multi_tab(GOOGLE_SHEETS_URL)
         else:
             print("Please provide a CSV file path or set GOOGLE_SHEETS_URL")
             print("Usage: python convert_to_json2.py [csv_file_path]")
             return
     
-    if df is None:
+    if sheet is None:
         return
     
-    print(f"Loaded {len(df)} rows")
+    columns, rows = sheet
+    print(f"Loaded {len(rows)} rows")
     
     # Validate data
-    if not validate_data(df):
+    if not validate_data(columns):
         return
     
-    # Convert each row to an activity
+    # Convert each row to an activity, validating it on the way
     activities = []
-    for idx, row in df.iterrows():
+    errors = 0
+    for idx, row in enumerate(rows):
         try:
-            activity = create_activity(row)
+            activity = create_activity(row, now_iso)
             activities.append(activity)
-            type_indicator = f"[{activity['type'][0].upper()}]"
-            print(f"✓ Processed {type_indicator}: {activity['name']}")
+            if args.verbose:
+                type_indicator = f"[{activity['type'][0].upper()}]"
+                print(f"✓ Processed {type_indicator}: {activity['name']}")
+            elif (idx + 1) % PROGRESS_EVERY == 0:
+                print(f"Processed {idx + 1}/{len(rows)}")
         except Exception as e:
-            print(f"✗ Error processing row {idx + 2}: {e}")
-            print(f"   Row data: {dict(row)}")
+            print(f"✗ Error processing row {idx + 2}: {e}")  # +2 for header and 0-index
+            print(f"   Row data: {row}")
+            errors += 1
+    
+    if errors > 0:
+        print(f"\nValidation failed with {errors} errors. Please fix the issues above.")
+        sys.exit(1)
+    
+    print(f"\n✓ Validation passed for {len(rows)} activities")
     
     # Generate summary
     generate_summary(activities)
@@ -636,7 +788,7 @@ def main():
     print(f"Successfully generated {len(activities)} activities")
     
     # Create proper JSON structure
-    output_data = create_output_structure(activities)
+    output_data = create_output_structure(activities, now_iso)
     
     # Determine output file
     if args.replace_default:
@@ -651,30 +803,38 @@ def main():
         print("\n" + "=" * 50)
         print("DRY RUN - JSON Output:")
         print("-" * 50)
-        print(json.dumps(output_data, indent=2, ensure_ascii=False))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(serialize_json(output_data) + b"\n")
+        sys.stdout.flush()
         return
     
     # Create output directory if it doesn't exist
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Backup existing file if requested
-    if not args.no_backup and output_file.exists():
-        backup_file(output_file)
-    
-    # Write the file
+    # Write to a temporary file first, so a failed write leaves the existing file in place
+    tmp_file = output_file.with_name(f"{output_file.name}.tmp.{os.getpid()}")
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        with open(tmp_file, 'wb') as f:
+            file_size = write_json_stream(output_data, f)
+        
+        # Backup existing file if requested
+        if not args.no_backup and output_file.exists():
+            backup_file(output_file)
+        
+        # Atomic swap: readers see either the old or the new file, never a partial one
+        os.replace(tmp_file, output_file)
         
         print(f"\n✅ JSON saved to: {output_file}")
         
         # Show file size
-        file_size = output_file.stat().st_size
         print(f"📊 File size: {file_size:,} bytes")
         
     except Exception as e:
         print(f"❌ Error writing file: {e}")
         return
+    finally:
+        if tmp_file.exists():
+            tmp_file.unlink()
     
     # Show usage examples
     print("\n" + "=" * 50)
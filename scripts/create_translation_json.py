@@ -1,13 +1,90 @@
 import requests
 import csv
+import io
 import json
 import os
 import shutil
-from datetime import datetime
+from datetime import datetime, timezone
 import argparse
 import re
+import string
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def generate_translation_cards(spreadsheet_id, sheet_gid, output_path="src/data/cards/vegan-phrases.json", backup=True, category_col=None):
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+# Retry transient Google errors (rate limits and 5xx) with exponential backoff
+RETRY_POLICY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+)
+
+# Card ID sanitizing: anything outside a-z/0-9 becomes a single '-'
+_ID_NONALNUM = re.compile(r'[^a-z0-9]+')
+_ID_ASCII_TABLE = str.maketrans({
+    c: '-' for c in map(chr, range(128)) if c not in string.ascii_lowercase + string.digits
+})
+
+def sanitize_id(text):
+    """Lowercases text and replaces each run of characters outside a-z/0-9 with one '-'."""
+    text = text.lower()
+    if text.isascii():
+        # ASCII fast path: one translate pass, then collapse the dash runs
+        text = text.translate(_ID_ASCII_TABLE)
+        while '--' in text:
+            text = text.replace('--', '-')
+        return text
+    return _ID_NONALNUM.sub('-', text)
+
+def serialize_json(data):
+    """Serializes data to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Values escape their quotes, so this byte pattern only occurs as the metadata key
+_CREATED_KEY = b'"created": "'
+
+def matches_existing_output(output_path, new_path, created):
+    """
+    Returns True if output_path already holds the cards in new_path, ignoring
+    the "created" timestamp (which changes on every run).
+    """
+    if not os.path.exists(output_path) or os.path.getsize(output_path) != os.path.getsize(new_path):
+        return False
+    with open(output_path, 'rb') as f:
+        old_bytes = f.read()
+    with open(new_path, 'rb') as f:
+        new_bytes = f.read()
+    start = old_bytes.find(_CREATED_KEY)
+    if start != -1:
+        start += len(_CREATED_KEY)
+        old_created = old_bytes[start:old_bytes.index(b'"', start)]
+        new_bytes = new_bytes.replace(_CREATED_KEY + created.encode('utf-8') + b'"', _CREATED_KEY + old_created + b'"')
+    return new_bytes == old_bytes
+
+_SESSION = None
+
+def get_session():
+    """
+    Returns the shared requests session used for Google Sheets downloads.
+    Connections are kept alive between requests and retried on transient errors;
+    callers can set auth or proxies on the returned session.
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(max_retries=RETRY_POLICY))
+        # Ask for a compressed CSV explicitly; the body is decoded while streaming
+        _SESSION.headers.update({"Accept-Encoding": "gzip, deflate", "User-Agent": "vegan-cards/0.1.0"})
+    return _SESSION
+
+def generate_translation_cards(spreadsheet_id, sheet_gid, output_path="src/data/cards/vegan-phrases.json", backup=False, category_col=None, force=False):
     """
     Reads translation data from a Google Sheet and generates a JSON file
     in the specified Translation Card Format.
@@ -16,131 +93,188 @@ def generate_translation_cards(spreadsheet_id, sheet_gid, output_path="src/data/
         spreadsheet_id (str): The ID of your Google Spreadsheet.
         sheet_gid (str): The GID of the specific sheet (tab) within the spreadsheet.
         output_path (str): Path to the JSON file to create.
-        backup (bool): Whether to backup existing file.
+        backup (bool): Whether to keep a timestamped backup of the file being replaced.
         category_col (str): Optional column name for category data.
+        force (bool): Regenerate even if the sheet is unchanged since the last run.
     """
     # Create directory if it doesn't exist
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    # Backup existing file if it exists and backup is enabled
-    if backup and os.path.exists(output_path):
-        timestamp = int(datetime.now().timestamp())
-        backup_path = f"{output_path}.backup.{timestamp}"
-        shutil.copy2(output_path, backup_path)
-        print(f"Backed up existing file to {backup_path}")
-
     csv_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/export?format=csv&gid={sheet_gid}"
 
+    # ETag of the sheet the existing output was generated from
+    etag_path = f"{output_path}.etag"
+    tmp_path = f"{output_path}.tmp.{os.getpid()}"
+    headers = {}
+    if not force and os.path.exists(output_path) and os.path.exists(etag_path):
+        with open(etag_path, encoding='utf-8') as f:
+            etag = f.read().strip()
+        if etag:
+            headers["If-None-Match"] = etag
+
     try:
-        response = requests.get(csv_url)
-        response.raise_for_status()
-
-        csv_content = response.content.decode('utf-8')
-        csv_reader = csv.reader(csv_content.splitlines())
-
-        header = next(csv_reader)
-        print(f"Detected header: {header}")
-
-        # Get column indices based on header names
-        required_columns = ["Language 1", "Phrase 1", "Language 2", "Translation"]
-        column_indices = {}
-        
-        for col_name in required_columns:
-            try:
-                column_indices[col_name] = header.index(col_name)
-            except ValueError:
-                # Try alternative column name for backwards compatibility
-                if col_name == "Phrase 1" and "English Phrase" in header:
-                    column_indices[col_name] = header.index("English Phrase")
-                else:
-                    raise ValueError(f"Missing required column: '{col_name}'")
-        
-        # Check for optional category column
-        category_col_index = None
-        if category_col and category_col in header:
-            category_col_index = header.index(category_col)
-            print(f"Found category column at index {category_col_index}")
-        
-        # Check for optional tags column
-        tags_col_index = None
-        if "Tags" in header:
-            tags_col_index = header.index("Tags")
-            print(f"Found tags column at index {tags_col_index}")
-
-        translation_cards = []
-        current_time_iso = datetime.utcnow().isoformat(timespec='seconds') + 'Z'
-
-        for i, row in enumerate(csv_reader):
-            if not row or all(not cell.strip() for cell in row):
-                continue # Skip empty rows
-
-            # Ensure row has enough columns
-            max_required_index = max(column_indices.values())
-            if len(row) <= max_required_index:
-                print(f"Skipping row {i+2} due to insufficient columns: {row}")
-                continue
-
-            language1_name = row[column_indices["Language 1"]].strip()
-            phrase1 = row[column_indices["Phrase 1"]].strip()
-            language2_name = row[column_indices["Language 2"]].strip()
-            translation = row[column_indices["Translation"]].strip()
-
-            # Skip row if essential content is missing
-            if not phrase1 or not translation:
-                print(f"Skipping row {i+2} due to missing phrase or translation.")
-                continue
-
-            # Determine category
-            category = "restaurant"  # Default category
-            if category_col_index is not None and len(row) > category_col_index and row[category_col_index].strip():
-                category = row[category_col_index].strip().lower()
-
-            # Process tags
-            tags = ["vegan", category]  # Default tags
-            if tags_col_index is not None and len(row) > tags_col_index and row[tags_col_index].strip():
-                custom_tags = [tag.strip().lower() for tag in row[tags_col_index].split(',') if tag.strip()]
-                tags.extend(custom_tags)
-            
-            # Remove duplicates from tags while preserving order
-            tags = list(dict.fromkeys(tags))
+        # Stream the body straight into the CSV reader instead of buffering it
+        with get_session().get(csv_url, headers=headers, timeout=(5, 30), stream=True) as response:
+            response.raise_for_status()
+            if response.status_code == 304:
+                print(f"Sheet unchanged since the last run, keeping '{output_path}' (use --force to regenerate)")
+                return
 
-            # Create a sanitized ID based on languages and the phrase
-            base_id = re.sub(r'[^a-z0-9]', '-', phrase1.lower())
-            base_id = re.sub(r'-+', '-', base_id)  # Replace multiple hyphens with a single one
-            base_id = base_id[:20].strip('-')  # Limit length and trim trailing hyphens
+            response.raw.decode_content = True
+            response.raw.auto_close = False  # let TextIOWrapper see EOF rather than a closed file
+            csv_reader = csv.reader(io.TextIOWrapper(response.raw, encoding='utf-8-sig', newline=''))
+
+            header = next(csv_reader)
+            print(f"Detected header: {header}")
+
+            # Get column indices based on header names
+            required_columns = ["Language 1", "Phrase 1", "Language 2", "Translation"]
+            column_indices = {}
+            
+            for col_name in required_columns:
+                try:
+                    column_indices[col_name] = header.index(col_name)
+                except ValueError:
+                    # Try alternative column name for backwards compatibility
+                    if col_name == "Phrase 1" and "English Phrase" in header:
+                        column_indices[col_name] = header.index("English Phrase")
+                    else:
+                        raise ValueError(f"Missing required column: '{col_name}'")
             
-            # Add language codes to ID (first 2 chars of each language)
-            lang1_code = language1_name[:2].lower()
-            lang2_code = language2_name[:2].lower()
-            card_id = f"vegan-{lang1_code}-{lang2_code}-{base_id}-{i+1}"
+            # Check for optional category column
+            category_col_index = None
+            if category_col and category_col in header:
+                category_col_index = header.index(category_col)
+                print(f"Found category column at index {category_col_index}")
+            
+            # Check for optional tags column
+            tags_col_index = None
+            if "Tags" in header:
+                tags_col_index = header.index("Tags")
+                print(f"Found tags column at index {tags_col_index}")
+
+            current_time_iso = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
 
+            # Loop invariants
+            lang1_idx, phrase1_idx, lang2_idx, translation_idx = (column_indices[c] for c in required_columns)
+            max_required_index = max(column_indices.values())
+            tag_cache = {}
+
+            # Cards are serialized as soon as they are built, so one card dict is refilled for every row
             card = {
-                "id": card_id,
+                "id": None,
                 "type": "translation",
-                "category": category,
-                "language1": language1_name,
-                "language2": language2_name,
+                "category": None,
+                "language1": None,
+                "language2": None,
                 "frontContent": {
-                    "title": language1_name,
-                    "content": phrase1,
+                    "title": None,
+                    "content": None,
                     "imageUrl": None
                 },
                 "backContent": {
-                    "title": language2_name,
-                    "content": translation,
+                    "title": None,
+                    "content": None,
                     "imageUrl": None
                 },
                 "metadata": {
                     "created": current_time_iso,
-                    "tags": tags
+                    "tags": None
                 }
             }
-            translation_cards.append(card)
+            front_content, back_content, metadata = card["frontContent"], card["backContent"], card["metadata"]
+
+            # Cards are written out as they are built rather than collected in a list
+            # (into a temporary file first, so an unchanged result can leave output_path untouched
+            # and a failed run never leaves a partial file)
+            card_count = 0
+            with open(tmp_path, 'wb') as f:
+                f.write(b'[')
+                for i, row in enumerate(csv_reader):
+                    # isspace() is False for '', hence the extra truthiness check
+                    if not any(cell and not cell.isspace() for cell in row):
+                        continue # Skip empty rows
+
+                    # Ensure row has enough columns
+                    row_len = len(row)
+                    if row_len <= max_required_index:
+                        print(f"Skipping row {i+2} due to insufficient columns: {row}")
+                        continue
+
+                    language1_name = row[lang1_idx].strip()
+                    phrase1 = row[phrase1_idx].strip()
+                    language2_name = row[lang2_idx].strip()
+                    translation = row[translation_idx].strip()
+
+                    # Skip row if essential content is missing
+                    if not phrase1 or not translation:
+                        print(f"Skipping row {i+2} due to missing phrase or translation.")
+                        continue
+
+                    # Determine category
+                    category_cell = row[category_col_index].strip() if category_col_index is not None and row_len > category_col_index else ''
+                    category = category_cell.lower() if category_cell else "restaurant"  # Default category
+
+                    # Process tags (rows with the same category and tags cell share one list)
+                    tags_cell = row[tags_col_index].strip() if tags_col_index is not None and row_len > tags_col_index else ''
+                    tags_key = (category, tags_cell)
+                    tags = tag_cache.get(tags_key)
+                    if tags is None:
+                        tags = ["vegan", category]  # Default tags
+                        if tags_cell:
+                            custom_tags = [tag.strip().lower() for tag in tags_cell.split(',') if tag.strip()]
+                            tags.extend(custom_tags)
+                        
+                        # Remove duplicates from tags while preserving order
+                        tags = tag_cache[tags_key] = list(dict.fromkeys(tags))
+
+                    # Create a sanitized ID based on languages and the phrase
+                    base_id = sanitize_id(phrase1)[:20].strip('-')  # Limit length and trim trailing hyphens
+                    
+                    # Add language codes to ID (first 2 chars of each language)
+                    lang1_code = language1_name[:2].lower()
+                    lang2_code = language2_name[:2].lower()
+                    card["id"] = f"vegan-{lang1_code}-{lang2_code}-{base_id}-{i+1}"
+                    card["category"] = category
+                    card["language1"] = front_content["title"] = language1_name
+                    card["language2"] = back_content["title"] = language2_name
+                    front_content["content"] = phrase1
+                    back_content["content"] = translation
+                    metadata["tags"] = tags
+
+                    # Write each card as it is built, in the layout json.dump(cards, indent=2) produces
+                    if card_count:
+                        f.write(b',')
+                    f.write(b'\n  ' + serialize_json(card).replace(b'\n', b'\n  '))
+                    card_count += 1
+
+                f.write(b'\n]' if card_count else b']')
+
+        if matches_existing_output(output_path, tmp_path, current_time_iso):
+            os.remove(tmp_path)
+            print(f"No changes in {card_count} translation cards, '{output_path}' left untouched.")
+        else:
+            # Backup existing file if it exists and backup is enabled
+            if backup and os.path.exists(output_path):
+                timestamp = int(datetime.now().timestamp())
+                backup_path = f"{output_path}.backup.{timestamp}"
+                try:
+                    os.link(output_path, backup_path)  # the old file is renamed away below, so a link is enough
+                except OSError:
+                    shutil.copy2(output_path, backup_path)
+                print(f"Backed up existing file to {backup_path}")
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(translation_cards, f, indent=2, ensure_ascii=False)
+            # Atomic swap: readers see either the old or the new file, never a partial one
+            os.replace(tmp_path, output_path)
+            print(f"Successfully created '{output_path}' with {card_count} translation cards.")
 
-        print(f"Successfully created '{output_path}' with {len(translation_cards)} translation cards.")
+        # Remember the sheet version so an unchanged sheet can be skipped next time
+        etag = response.headers.get("ETag")
+        if etag:
+            with open(etag_path, 'w', encoding='utf-8') as f:
+                f.write(etag)
+        elif os.path.exists(etag_path):
+            os.remove(etag_path)
 
     except requests.exceptions.RequestException as e:
         print(f"Error fetching data from Google Sheet: {e}")
@@ -150,6 +284,10 @@ def generate_translation_cards(spreadsheet_id, sheet_gid, output_path="src/data/
         print("Please ensure your Google Sheet has the required columns: 'Language 1', 'Phrase 1', 'Language 2', and 'Translation'.")
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
+    finally:
+        # Don't leave a half-written file behind after an error
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 def main():
     parser = argparse.ArgumentParser(description="Generate translation cards JSON from Google Sheets")
@@ -159,10 +297,14 @@ def main():
                         help="Sheet GID (tab identifier)")
     parser.add_argument("--output", default="src/data/cards/vegan-phrases.json", 
                         help="Output JSON file path")
+    parser.add_argument("--backup", action="store_true", 
+                        help="Keep a timestamped backup of the file being replaced (git history usually suffices)")
     parser.add_argument("--no-backup", action="store_true", 
-                        help="Disable backup of existing file")
+                        help="Don't back up the existing file (the default; kept for compatibility)")
     parser.add_argument("--category-column", default="Category", 
                         help="Name of the category column in the spreadsheet")
+    parser.add_argument("--force", action="store_true", 
+                        help="Regenerate even if the sheet is unchanged since the last run")
     
     args = parser.parse_args()
     
@@ -170,8 +312,9 @@ def main():
         args.spreadsheet_id, 
         args.sheet_gid,
         args.output,
-        not args.no_backup,
-        args.category_column
+        args.backup and not args.no_backup,
+        args.category_column,
+        args.force
     )
 
 # Run the script